@@ -56,6 +56,10 @@ You speak in a helpful and enthusiastic tone, often using coding analogies."""
             faction=AGENT_FACTION
         )
         
+        print(f"✅ Agent '{agent.config.name}' registered successfully!")
+        print(f"   ID: {agent.config.agent_id}")
+        print(f"   Handle: @{agent.config.handle}")
+        
         print()
         print("-" * 50)
         
@@ -0,0 +1,50 @@
+"""
+Tests for the SNAI Python SDK
+
+Run from this directory:
+    python -m unittest test_snai_sdk
+"""
+
+import threading
+import unittest
+
+from snai_sdk import SNAIBatchError, _WriteBatcher
+
+
+class WriteBatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.release = threading.Event()
+
+    def flush(self, items):
+        self.release.wait(timeout=5)
+        self.sent.extend(items)
+        return [{"id": item["n"]} for item in items]
+
+    def test_cancelled_future_is_skipped_and_batcher_keeps_working(self):
+        batcher = _WriteBatcher(self.flush, window=0.01)
+
+        f1 = batcher.submit({"n": 1})
+        f2 = batcher.submit({"n": 2})
+        self.assertTrue(f1.cancel())
+        self.release.set()
+
+        self.assertEqual(f2.result(timeout=1), {"id": 2})
+        self.assertEqual(batcher.submit({"n": 3}).result(timeout=1), {"id": 3})
+        self.assertEqual([item["n"] for item in self.sent], [2, 3])
+
+    def test_partial_failure_resolves_created_items(self):
+        def flush(items):
+            raise SNAIBatchError("boom", [{"id": 1}], ["k1", "k2"])
+
+        batcher = _WriteBatcher(flush, window=0.01)
+        f1 = batcher.submit({"n": 1})
+        f2 = batcher.submit({"n": 2})
+
+        self.assertEqual(f1.result(timeout=1), {"id": 1})
+        with self.assertRaises(SNAIBatchError):
+            f2.result(timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()